@@ -3,11 +3,14 @@ from pathlib import Path
 from typing import Dict, List, Any
 import os
 from analysis.utils import extract_trajectories_from_dump
-from analysis.trace_loader import TraceLoader
-from collections import defaultdict
+from analysis.trace_loader import TraceLoader, S3_SSE_KEY_RE
+from collections import Counter, defaultdict
 import re
 import ujson as json
 
+# local pattern: {trace_id}_{timestamp}-sse_events_{sequence}.json
+_LOCAL_SSE_NAME_RE = re.compile(r"([a-f0-9_]+)-sse_events_(\d+)\.json")
+
 
 def get_trace_pattern(file_type: str) -> str:
     """Get the pattern for trace files based on selected type."""
@@ -25,19 +28,20 @@ def group_sse_events(sse_files: List[Dict[str, Any]]) -> Dict[str, List[Dict[str
     trace_groups = defaultdict(list)
 
     for file_info in sse_files:
+        if "trace_id" in file_info:
+            # already parsed when the S3 listing was built
+            trace_groups[file_info["trace_id"]].append(file_info)
+            continue
+
         trace_id = None
         sequence = None
 
         if file_info.get("is_local", True):
-            # local pattern: {trace_id}_{timestamp}-sse_events_{sequence}.json
-            filename = file_info["name"]
-            match = re.match(r"([a-f0-9_]+)-sse_events_(\d+)\.json", filename)
+            match = _LOCAL_SSE_NAME_RE.match(file_info["name"])
             if match:
                 trace_id, sequence = match.groups()
         else:
-            # s3 pattern: app-{app_id}.req-{req_id}_{timestamp}/sse_events/{sequence}.json
-            path = file_info["path"]
-            match = re.match(r"(app-[a-f0-9-]+\.req-[a-f0-9-]+)_\d+/sse_events/(\d+)\.json", path)
+            match = S3_SSE_KEY_RE.match(file_info["path"])
             if match:
                 trace_id, sequence = match.groups()
                 # trace_id now has timestamp stripped (app-xxx.req-xxx)
@@ -54,6 +58,16 @@ def group_sse_events(sse_files: List[Dict[str, Any]]) -> Dict[str, List[Dict[str
     return dict(trace_groups)
 
 
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def load_fsm_trajectories(path: str, modified: Any, _content: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Extract trajectories from an FSM dump, cached by file path and modification time.
+
+    Extraction replays the whole state machine, so re-processing the same file should not redo it.
+    The cache is shared across sessions, so it is bounded to keep full dumps from piling up in memory.
+    """
+    return extract_trajectories_from_dump(_content)
+
+
 @st.cache_data
 def get_status_icon(status: str) -> str:
     """Get cached status icon for better performance."""
@@ -255,6 +269,7 @@ def main():
             if not traces_location.exists():
                 st.error(f"Traces directory not found: {traces_location}")
                 return
+            key_prefix = ""
         else:
             # s3 bucket selection
             s3_bucket_options = ["staging-agent-service-snapshots", "prod-agent-service-snapshots", "custom"]
@@ -279,6 +294,13 @@ def main():
 
             traces_location = s3_bucket
 
+            key_prefix = st.text_input(
+                "Key Prefix",
+                value="",
+                placeholder="app-<app_id>",
+                help="Only list objects under this key prefix; avoids scanning the whole bucket",
+            )
+
         # initialize trace loader
         trace_loader = TraceLoader(str(traces_location))
 
@@ -300,7 +322,7 @@ def main():
             return
 
         # get list of files
-        fsm_files = trace_loader.list_trace_files([pattern])
+        fsm_files = trace_loader.list_trace_files([pattern], prefix=key_prefix)
 
         if not fsm_files:
             st.warning(f"No {file_type} files found")
@@ -448,27 +470,32 @@ def main():
                     trace_loader = st.session_state.trace_loader
                     sse_events = []
 
-                    # load ALL SSE event files in the group (full sequence)
+                    # load ALL SSE event files in the group (full sequence), fetching them concurrently
+                    loaded_events = trace_loader.load_files_bulk(trace_group)
                     for file_info in trace_group:
-                        try:
-                            event_content = trace_loader.load_file(file_info)
-                            # pre-process event for faster display
-                            event_content["sequence"] = file_info["sequence"]
-                            event_content["trace_id"] = file_info["trace_id"]
-
-                            # extract commonly accessed fields for faster search
-                            message = event_content.get("message", {})
-                            event_content["_search_text"] = " ".join(
-                                [
-                                    str(event_content.get("status", "")),
-                                    str(message.get("kind", "")),
-                                    str(message.get("content", ""))[:500],  # limit content for search
-                                ]
-                            ).lower()
-
-                            sse_events.append(event_content)
-                        except Exception as e:
-                            st.error(f"Error loading {file_info.get('name', file_info.get('path'))}: {str(e)}")
+                        event_content = loaded_events[file_info["path"]]
+                        if isinstance(event_content, Exception):
+                            st.error(f"Error loading {file_info.get('name', file_info.get('path'))}: {str(event_content)}")
+                            continue
+                        if not isinstance(event_content, dict):
+                            st.error(f"Error loading {file_info.get('name', file_info.get('path'))}: expected a JSON object")
+                            continue
+
+                        # pre-process event for faster display
+                        event_content["sequence"] = file_info["sequence"]
+                        event_content["trace_id"] = file_info["trace_id"]
+
+                        # extract commonly accessed fields for faster search
+                        message = event_content.get("message", {})
+                        event_content["_search_text"] = " ".join(
+                            [
+                                str(event_content.get("status", "")),
+                                str(message.get("kind", "")),
+                                str(message.get("content", ""))[:500],  # limit content for search
+                            ]
+                        ).lower()
+
+                        sse_events.append(event_content)
 
                     # sort by sequence number
                     sse_events.sort(key=lambda x: x.get("sequence", 0))
@@ -499,7 +526,7 @@ def main():
 
                     if "fsm_enter" in filename or "fsm_exit" in filename:
                         # FSM traces - use the existing extraction logic
-                        messages = extract_trajectories_from_dump(file_content)
+                        messages = load_fsm_trajectories(current_file["path"], current_file["modified"], file_content)
                         st.session_state.messages = messages
                         st.session_state.trace_type = "fsm"
                     elif "fsmtools_messages" in filename:
@@ -626,18 +653,16 @@ def main():
             st.header("Server-Sent Events Stream")
 
             # summary metrics (optimized - single pass)
-            status_counts = {}
-            kind_counts = {}
+            status_counts = Counter()
+            kind_counts = Counter()
 
             for event in sse_events:
                 # count statuses
-                status = event.get("status", "unknown")
-                status_counts[status] = status_counts.get(status, 0) + 1
+                status_counts[event.get("status", "unknown")] += 1
 
                 # count message kinds
                 message = event.get("message", {})
-                kind = message.get("kind", "Unknown")
-                kind_counts[kind] = kind_counts.get(kind, 0) + 1
+                kind_counts[message.get("kind", "Unknown")] += 1
 
             st.metric("Total Events", len(sse_events))
 
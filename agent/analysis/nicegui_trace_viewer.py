@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Interactive LLM Conversation Chain Viewer"""
 
+import contextlib
+import io
 import json
 import sys
 from pathlib import Path
@@ -8,6 +10,9 @@ from typing import Dict, List, Any
 from datetime import datetime
 import re
 
+ROLE_DISPLAY = {"user": "👤 USER", "assistant": "🤖 ASSISTANT"}
+MESSAGE_SEPARATOR = "-" * 40
+
 
 def format_content(content, format="display"):
     """Format message content for display"""
@@ -110,6 +115,14 @@ def build_conversation_chains(nodes: List[Dict]) -> List[List[Dict]]:
     return chains
 
 
+def extract_tool_names(msg: Dict) -> List[str]:
+    """Get names of tools referenced in a message"""
+    content = str(msg.get("content", ""))
+    if "tool_use" in content:
+        return re.findall(r'"name":\s*"([^"]+)"', content)
+    return []
+
+
 def get_chain_summary(chain: List[Dict]) -> Dict:
     """Get summary info about a chain"""
     total_messages = 0
@@ -136,10 +149,7 @@ def get_chain_summary(chain: List[Dict]) -> Dict:
             last_message = msg
 
             # extract tools
-            content = str(msg.get("content", ""))
-            if "tool_use" in content:
-                tool_matches = re.findall(r'"name":\s*"([^"]+)"', content)
-                tools_used.update(tool_matches)
+            tools_used.update(extract_tool_names(msg))
 
     return {
         "length": len(chain),
@@ -182,35 +192,32 @@ def display_chain_list(chains: List[List[Dict]]):
         )
 
 
-def display_conversation(chain: List[Dict], chain_num: int):
-    """Display a single conversation with nice formatting"""
-    print(f"\n{'=' * 80}")
-    print(f"CONVERSATION {chain_num}")
-    print(f"{'=' * 80}")
+def display_conversation(chain: List[Dict], chain_num: int, formatted_cache: Dict[int, str] | None = None):
+    """Display a single conversation with nice formatting
 
-    summary = get_chain_summary(chain)
-    print(f"📊 {summary['length']} nodes • {summary['total_messages']} messages")
-    if summary["tools_used"]:
-        print(f"🔧 Tools: {', '.join(summary['tools_used'])}")
-    print()
+    Chains built from different leaves share their ancestor nodes, so callers rendering several
+    chains can pass one formatted_cache to format each shared message only once.
+    """
+    if formatted_cache is None:
+        formatted_cache = {}
 
     message_count = 0
+    tools_used = set()
+    # collect the whole conversation and write it once instead of several prints per message;
+    # header stats are gathered in the same pass rather than walking the chain again
+    parts = []
 
     for node_idx, node in enumerate(chain):
         messages = node.get("data", {}).get("messages", [])
 
         for msg in messages:
             message_count += 1
+            tools_used.update(extract_tool_names(msg))
             role = msg.get("role", "unknown")
             timestamp = msg.get("timestamp", "")
 
             # format role with emoji
-            if role == "user":
-                role_display = "👤 USER"
-            elif role == "assistant":
-                role_display = "🤖 ASSISTANT"
-            else:
-                role_display = f"📝 {role.upper()}"
+            role_display = ROLE_DISPLAY.get(role) or f"📝 {role.upper()}"
 
             # format timestamp
             time_str = ""
@@ -218,12 +225,24 @@ def display_conversation(chain: List[Dict], chain_num: int):
                 dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
                 time_str = dt.strftime("%H:%M:%S")
 
-            print(f"{message_count}. {role_display} {time_str}")
-            print("-" * 40)
+            # keyed by message identity: the same dict is reused by every chain through this node;
+            # format_content's warnings are captured and cached with the text so they stay in this block
+            content = formatted_cache.get(id(msg))
+            if content is None:
+                with contextlib.redirect_stdout(io.StringIO()) as warnings:
+                    formatted = format_content(msg.get("content", ""), "display")
+                content = formatted_cache[id(msg)] = f"{warnings.getvalue()}{formatted}"
+            parts.append(f"{message_count}. {role_display} {time_str}\n{MESSAGE_SEPARATOR}\n{content}\n\n")
+
+    print(f"\n{'=' * 80}")
+    print(f"CONVERSATION {chain_num}")
+    print(f"{'=' * 80}")
+    print(f"📊 {len(chain)} nodes • {message_count} messages")
+    if tools_used:
+        print(f"🔧 Tools: {', '.join(tools_used)}")
+    print()
 
-            content = format_content(msg.get("content", ""), "display")
-            print(content)
-            print()
+    sys.stdout.write("".join(parts))
 
 
 def display_summary(chains: List[List[Dict]]):
@@ -231,8 +250,9 @@ def display_summary(chains: List[List[Dict]]):
     print("\n📊 SUMMARY STATISTICS")
     print("=" * 50)
 
+    summaries = [get_chain_summary(chain) for chain in chains]
     total_nodes = sum(len(chain) for chain in chains)
-    total_messages = sum(get_chain_summary(chain)["total_messages"] for chain in chains)
+    total_messages = sum(summary["total_messages"] for summary in summaries)
 
     print(f"Total chains: {len(chains)}")
     print(f"Total nodes: {total_nodes}")
@@ -246,8 +266,7 @@ def display_summary(chains: List[List[Dict]]):
 
     # tool usage
     all_tools = set()
-    for chain in chains:
-        summary = get_chain_summary(chain)
+    for summary in summaries:
         all_tools.update(summary["tools_used"])
 
     if all_tools:
@@ -275,8 +294,9 @@ def main():
         chains.sort(key=len, reverse=True)
 
         # show all chains
+        formatted_cache = {}
         for i, chain in enumerate(chains, 1):
-            display_conversation(chain, i)
+            display_conversation(chain, i, formatted_cache)
             if i < len(chains):
                 print("\n" + "=" * 100)
                 print("=" * 100)
@@ -1,13 +1,23 @@
 import ujson as json
 import boto3
-from pathlib import Path
+from botocore.config import Config
 from typing import List, Dict, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
 import os
+import re
 from log import get_logger
 
 logger = get_logger(__name__)
 
+# objects above this size are fetched as parallel byte ranges instead of a single GET
+RANGED_GET_THRESHOLD = 8 * 1024 * 1024
+RANGED_GET_PARTS = 4
+
+# s3 pattern: app-{app_id}.req-{req_id}_{timestamp}/sse_events/{sequence}.json
+S3_SSE_KEY_RE = re.compile(r"(app-[a-f0-9-]+\.req-[a-f0-9-]+)_\d+/sse_events/(\d+)\.json")
+
 
 class TraceLoader:
     """Utility class to load traces from either local filesystem or S3."""
@@ -38,35 +48,44 @@ class TraceLoader:
             logger.info(f"S3 bucket not available: {e}")
             return False
 
-    def list_trace_files(self, patterns: List[str]) -> List[Dict[str, Any]]:
-        """List all trace files matching the given patterns."""
+    def list_trace_files(self, patterns: List[str], prefix: str = "") -> List[Dict[str, Any]]:
+        """List all trace files matching the given patterns.
+
+        A non-empty prefix restricts the listing to keys (or local file names) starting with it,
+        which lets S3 prune the listing server-side instead of scanning the whole bucket.
+        """
         if self.is_local:
-            return self._list_local_files(patterns)
+            return self._list_local_files(patterns, prefix)
         elif self.is_available:
-            return self._list_s3_files(patterns)
+            return self._list_s3_files(patterns, prefix)
         else:
             return []
 
-    def _list_local_files(self, patterns: List[str]) -> List[Dict[str, Any]]:
+    def _list_local_files(self, patterns: List[str], prefix: str = "") -> List[Dict[str, Any]]:
         """List local files matching patterns."""
         files = []
-        directory = Path(self.bucket_or_path)
-
-        for pattern in patterns:
-            for file_path in directory.glob(pattern):
-                files.append(
-                    {
-                        "path": str(file_path),
-                        "name": file_path.name,
-                        "modified": datetime.fromtimestamp(file_path.stat().st_mtime),
-                        "size": file_path.stat().st_size,
-                        "is_local": True,
-                    }
-                )
+        full_patterns = [f"{prefix}{pattern}" for pattern in patterns]
+
+        # single scandir pass over the directory; DirEntry yields the name without building a Path
+        # per entry and lets us stat each match once instead of twice
+        with os.scandir(self.bucket_or_path) as entries:
+            for entry in entries:
+                for pattern in full_patterns:
+                    if fnmatch.fnmatchcase(entry.name, pattern):
+                        stat = entry.stat()
+                        files.append(
+                            {
+                                "path": entry.path,
+                                "name": entry.name,
+                                "modified": datetime.fromtimestamp(stat.st_mtime),
+                                "size": stat.st_size,
+                                "is_local": True,
+                            }
+                        )
 
         return sorted(files, key=lambda x: x["modified"], reverse=True)
 
-    def _list_s3_files(self, patterns: List[str]) -> List[Dict[str, Any]]:
+    def _list_s3_files(self, patterns: List[str], prefix: str = "") -> List[Dict[str, Any]]:
         """List S3 objects matching patterns."""
         files = []
         s3_client = boto3.client("s3")
@@ -74,11 +93,11 @@ class TraceLoader:
         try:
             # optimize for SSE events by using prefix-based filtering
             if len(patterns) == 1 and patterns[0] == "*sse_events*":
-                files.extend(self._list_s3_sse_events(s3_client))
+                files.extend(self._list_s3_sse_events(s3_client, prefix))
             else:
-                # fallback to full bucket scan for other patterns
+                # fallback to full bucket (or prefix) scan for other patterns
                 paginator = s3_client.get_paginator("list_objects_v2")
-                pages = paginator.paginate(Bucket=self.bucket_or_path)
+                pages = paginator.paginate(Bucket=self.bucket_or_path, Prefix=prefix)
 
                 for page in pages:
                     if "Contents" not in page:
@@ -106,14 +125,14 @@ class TraceLoader:
 
         return sorted(files, key=lambda x: x["modified"], reverse=True)
 
-    def _list_s3_sse_events(self, s3_client) -> List[Dict[str, Any]]:
+    def _list_s3_sse_events(self, s3_client, prefix: str = "") -> List[Dict[str, Any]]:
         """Fast single-call listing for SSE events with client-side filtering."""
         files = []
 
         try:
-            # single paginated call to list all objects, filter for sse_events
+            # single paginated call to list all objects under the prefix, filter for sse_events
             paginator = s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.bucket_or_path)
+            pages = paginator.paginate(Bucket=self.bucket_or_path, Prefix=prefix)
 
             for page in pages:
                 if "Contents" not in page:
@@ -123,15 +142,20 @@ class TraceLoader:
                     key = obj["Key"]
                     # fast string check: only process SSE event files
                     if "/sse_events/" in key and key.endswith(".json"):
-                        files.append(
-                            {
-                                "path": key,
-                                "name": os.path.basename(key),
-                                "modified": obj["LastModified"],
-                                "size": obj["Size"],
-                                "is_local": False,
-                            }
-                        )
+                        file_info = {
+                            "path": key,
+                            "name": os.path.basename(key),
+                            "modified": obj["LastModified"],
+                            "size": obj["Size"],
+                            "is_local": False,
+                        }
+                        # parse trace id and sequence once here so grouping doesn't re-scan every key
+                        match = S3_SSE_KEY_RE.match(key)
+                        if match:
+                            trace_id, sequence = match.groups()
+                            file_info["trace_id"] = trace_id
+                            file_info["sequence"] = int(sequence)
+                        files.append(file_info)
 
         except Exception as e:
             logger.exception(f"Error listing SSE events: {e}")
@@ -167,21 +191,68 @@ class TraceLoader:
         if file_info.get("is_local", True):
             return self._load_local_file(file_info["path"])
         else:
-            return self._load_s3_file(file_info["path"])
+            return self._load_s3_file(file_info["path"], size=file_info.get("size"))
+
+    def load_files_bulk(self, file_infos: List[Dict[str, Any]], max_workers: int = 32) -> Dict[str, Any]:
+        """Load many trace files concurrently, keyed by path.
+
+        A file that fails to load maps to the raised exception instead of its content,
+        so callers can report per-file errors the same way as with load_file.
+        """
+        # boto3 clients are thread-safe, creating them is not - share one across workers, with a connection
+        # pool big enough for every worker and the ranged GETs each large object fans out into
+        s3_client = (
+            boto3.client("s3", config=Config(max_pool_connections=max_workers * RANGED_GET_PARTS))
+            if any(not f.get("is_local", True) for f in file_infos)
+            else None
+        )
+
+        def _load(file_info: Dict[str, Any]) -> Any:
+            try:
+                if file_info.get("is_local", True):
+                    return self._load_local_file(file_info["path"])
+                return self._load_s3_file(file_info["path"], s3_client, size=file_info.get("size"))
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_load, file_infos)
+            return {file_info["path"]: result for file_info, result in zip(file_infos, results)}
 
     def _load_local_file(self, path: str) -> Dict[str, Any]:
         """Load a file from local filesystem."""
         with open(path, "r") as f:
             return json.load(f)
 
-    def _load_s3_file(self, key: str) -> Dict[str, Any]:
-        """Load a file from S3."""
-        s3_client = boto3.client("s3")
+    def _load_s3_file(self, key: str, s3_client=None, size: int | None = None) -> Dict[str, Any]:
+        """Load a file from S3.
+
+        The object size is known from the listing, so large objects go straight to ranged GETs
+        without an extra HEAD request.
+        """
+        s3_client = s3_client or boto3.client("s3")
 
         try:
-            response = s3_client.get_object(Bucket=self.bucket_or_path, Key=key)
-            content = response["Body"].read()
+            if size is not None and size > RANGED_GET_THRESHOLD:
+                content = self._get_s3_object_ranged(s3_client, key, size)
+            else:
+                response = s3_client.get_object(Bucket=self.bucket_or_path, Key=key)
+                content = response["Body"].read()
             return json.loads(content)
         except Exception:
             logger.exception(f"Error loading S3 file {key}")
             raise
+
+    def _get_s3_object_ranged(self, s3_client, key: str, size: int) -> bytes:
+        """Download an S3 object as parallel byte-range GETs and reassemble it."""
+        part_size = -(-size // RANGED_GET_PARTS)  # ceil division
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        def _get_range(byte_range: tuple[int, int]) -> bytes:
+            response = s3_client.get_object(
+                Bucket=self.bucket_or_path, Key=key, Range=f"bytes={byte_range[0]}-{byte_range[1]}"
+            )
+            return response["Body"].read()
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            return b"".join(executor.map(_get_range, ranges))
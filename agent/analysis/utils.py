@@ -1,17 +1,20 @@
-from fire import Fire
 import ujson as json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 import os
 from glob import glob
 
-from core.statemachine import StateMachine
-from trpc_agent.application import ApplicationContext, FSMEvent, FSMApplication, Node
-from trpc_agent.actors import ConcurrentActor, DraftActor, TrpcActor
-import dagger
 import anyio
 
+if TYPE_CHECKING:
+    from trpc_agent.application import Node
+
 
 async def _get_actors(data: Dict[str, Any]):
+    # heavy deps are imported lazily so importing this module (e.g. from the streamlit app) stays cheap
+    import dagger
+    from core.statemachine import StateMachine
+    from trpc_agent.application import ApplicationContext, FSMEvent, FSMApplication
+
     async with dagger.Connection(dagger.Config(log_output=open(os.devnull, "w"))) as client:
         root = await FSMApplication.make_states(client)
     fsm = await StateMachine[ApplicationContext, FSMEvent].load(root, data, ApplicationContext)
@@ -23,7 +26,7 @@ async def _get_actors(data: Dict[str, Any]):
             return actors
 
 
-def get_all_trajectories(root: Node, prefix: str = ""):
+def get_all_trajectories(root: "Node", prefix: str = ""):
     nodes = list(filter(lambda x: x.is_leaf, root.get_all_children()))
     for i, n in enumerate(nodes):
         leaf_messages = []
@@ -39,6 +42,8 @@ def extract_trajectories_from_dump(data: Dict[str, Any]) -> Dict[str, List[Dict[
     Args:
         data: Dict containing the FSM checkpoint data
     """
+    from trpc_agent.actors import ConcurrentActor, DraftActor, TrpcActor
+
     actors = anyio.run(_get_actors, data)
     messages = {}
 
@@ -105,21 +110,21 @@ def main(dumps_path: str, output_path: str):
 
     # for AI-assisted analysis, we can format the output in a more readable way
     for file_name, trajectories in final_result.items():
-        acc = ""  # markdown accumulator for final output
-        for key, messages in trajectories.items():
-            acc += f"Trajectory: {key}\n"
-            for msg in messages:
-                role = msg.get("role", "unknown")
-                content = msg.get("content", [])
-                for x in content:
-                    if x.get("text"):
-                        acc += f"- **{role}**:\n {x['text']}\n\n"
-                    else:
-                        acc += f"- **{role}**: {x}\n\n"
-
-        with open(os.path.join(output_path, file_name.replace(".json", ".txt")), "w") as f:
-            f.write(acc)
+        # write through to disk instead of accumulating the whole markdown in memory
+        with open(os.path.join(output_path, file_name.replace(".json", ".txt")), "w", buffering=1 << 20) as f:
+            for key, messages in trajectories.items():
+                f.write(f"Trajectory: {key}\n")
+                for msg in messages:
+                    role = msg.get("role", "unknown")
+                    content = msg.get("content", [])
+                    for x in content:
+                        if x.get("text"):
+                            f.write(f"- **{role}**:\n {x['text']}\n\n")
+                        else:
+                            f.write(f"- **{role}**: {x}\n\n")
 
 
 if __name__ == "__main__":
+    from fire import Fire
+
     Fire(main)
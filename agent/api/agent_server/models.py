@@ -8,9 +8,8 @@ They are used by the `async_server.py` for data validation.
 Refer to `architecture.puml` for context within the system.
 """
 from enum import Enum
-import ujson as json
-from typing import Dict, List, Optional, Any, Union, Literal, Type, TypeVar
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Optional, Any, Union, Literal, Type, TypeVar
+from pydantic import BaseModel, Discriminator, Field, Tag, TypeAdapter
 import datetime
 
 
@@ -45,7 +44,7 @@ class UserMessage(BaseModel):
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Deserialize a JSON string to a model instance."""
-        return cls.model_validate(json.loads(json_str))
+        return cls.model_validate_json(json_str)
 
 
 class DiffStatEntry(BaseModel):
@@ -104,21 +103,29 @@ class AgentMessage(BaseModel):
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Deserialize a JSON string to a model instance."""
-        return cls.model_validate(json.loads(json_str))
+        return cls.model_validate_json(json_str)
 
 
-ConversationMessage = Union[UserMessage, AgentMessage]
+def _conversation_message_role(value: Any) -> Optional[str]:
+    """Pick the ConversationMessage variant by role; clients may omit the defaulted role, so fall back on the payload shape."""
+    if isinstance(value, dict):
+        role = value.get("role")
+        if role is None:
+            return "assistant" if "kind" in value else "user"
+        return role if isinstance(role, str) else None
+    return getattr(value, "role", None)
+
+
+ConversationMessage = Annotated[
+    Union[Annotated[UserMessage, Tag("user")], Annotated[AgentMessage, Tag("assistant")]],
+    Discriminator(_conversation_message_role),
+]
+_conversation_message_adapter: TypeAdapter[ConversationMessage] = TypeAdapter(ConversationMessage)
 
 
 def parse_conversation_message(json_str: str) -> ConversationMessage:
     """Parse a JSON string into the appropriate ConversationMessage type."""
-    data = json.loads(json_str)
-    if data.get("role") == "user":
-        return UserMessage.model_validate(data)
-    elif data.get("role") == "assistant":
-        return AgentMessage.model_validate(data)
-    else:
-        raise ValueError(f"Unknown role in message: {data.get('role')}")
+    return _conversation_message_adapter.validate_json(json_str)
 
 
 class AgentSseEvent(BaseModel):
@@ -135,7 +142,7 @@ class AgentSseEvent(BaseModel):
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Deserialize a JSON string to a model instance."""
-        return cls.model_validate(json.loads(json_str))
+        return cls.model_validate_json(json_str)
 
 
 class FileEntry(BaseModel):
@@ -168,7 +175,7 @@ class AgentRequest(BaseModel):
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Deserialize a JSON string to a model instance."""
-        return cls.model_validate(json.loads(json_str))
+        return cls.model_validate_json(json_str)
 
 
 class ErrorResponse(BaseModel):
@@ -183,7 +190,7 @@ class ErrorResponse(BaseModel):
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Deserialize a JSON string to a model instance."""
-        return cls.model_validate(json.loads(json_str))
+        return cls.model_validate_json(json_str)
 
 
 def format_internal_message_for_display(message) -> str:
@@ -8,6 +8,7 @@ import json
 import tempfile
 import shutil
 import dagger
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 
 from api.agent_server.interface import AgentInterface
@@ -18,6 +19,66 @@ from log import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_counter_app_patch() -> Tuple[Dict[str, str], Dict[str, str], str]:
+    """
+    Read and parse the bundled counter_app.patch.
+
+    The patch is static, so it is parsed once per process instead of on every request.
+
+    Returns:
+        Tuple containing server files, frontend files, and unified diff
+    """
+    # Use the pre-defined counter_app.patch file
+    patch_file_path = os.path.join(os.path.dirname(__file__), "counter_app.patch")
+
+    with open(patch_file_path, 'r') as f:
+        unified_diff = f.read()
+
+    # Extract files from the patch
+    server_files = {}
+    frontend_files = {}
+
+    # Parse the patch to extract file contents
+    current_file = None
+    current_content = []
+    file_path = None
+
+    for line in unified_diff.split('\n'):
+        # Check for new file headers
+        if line.startswith('diff --git'):
+            # Save previous file if exists
+            if current_file and file_path:
+                content = '\n'.join(current_content)
+                if file_path.startswith('server/'):
+                    server_files[os.path.basename(file_path)] = content
+                elif file_path.startswith('frontend/'):
+                    frontend_files[os.path.basename(file_path)] = content
+
+            # Reset for new file
+            current_file = line
+            current_content = []
+            file_path = None
+
+        # Extract file path from +++ line
+        elif line.startswith('+++') and not line.startswith('+++ /dev/null'):
+            file_path = line.split(' ')[1][2:]  # Remove "b/" prefix
+
+        # Collect content lines (those starting with +)
+        elif line.startswith('+') and not line.startswith('+++'):
+            current_content.append(line[1:])  # Remove the + sign
+
+    # Don't forget the last file
+    if current_file and file_path:
+        content = '\n'.join(current_content)
+        if file_path.startswith('server/'):
+            server_files[os.path.basename(file_path)] = content
+        elif file_path.startswith('frontend/'):
+            frontend_files[os.path.basename(file_path)] = content
+
+    return server_files, frontend_files, unified_diff
+
+
 class TemplateDiffAgentImplementation(AgentInterface):
     """
     Agent implementation that generates a counter application with unified diffs.
@@ -40,7 +101,7 @@ class TemplateDiffAgentImplementation(AgentInterface):
         self.settings = settings or {}
         self.state = {}
         self.temp_dir = tempfile.mkdtemp(prefix="template_diff_")
-        logger.info(f"Created temporary directory: {self.temp_dir}")
+        logger.info("Created temporary directory: %s", self.temp_dir)
 
     async def process(self, request, event_sender):
         """
@@ -51,7 +112,7 @@ class TemplateDiffAgentImplementation(AgentInterface):
             event_sender: Channel to send events back to the client
         """
         try:
-            logger.info(f"Processing request for application {self.application_id}, trace {self.trace_id}")
+            logger.info("Processing request for application %s, trace %s", self.application_id, self.trace_id)
 
             user_message = request.all_messages[-1].content if request.all_messages else "Create a counter app"
 
@@ -92,7 +153,7 @@ class TemplateDiffAgentImplementation(AgentInterface):
             ))
 
         except Exception as e:
-            logger.exception(f"Error processing request: {str(e)}")
+            logger.exception("Error processing request: %s", e)
 
             await event_sender.send(AgentSseEvent(
                 status=AgentStatus.IDLE,
@@ -121,56 +182,11 @@ class TemplateDiffAgentImplementation(AgentInterface):
         Returns:
             Tuple containing server files, frontend files, and unified diff
         """
-        logger.info(f"Generating counter app based on: {user_message}")
-
-        # Use the pre-defined counter_app.patch file
-        patch_file_path = os.path.join(os.path.dirname(__file__), "counter_app.patch")
-
-        with open(patch_file_path, 'r') as f:
-            unified_diff = f.read()
-
-        # Extract files from the patch
-        server_files = {}
-        frontend_files = {}
-
-        # Parse the patch to extract file contents
-        current_file = None
-        current_content = []
-        file_path = None
-
-        for line in unified_diff.split('\n'):
-            # Check for new file headers
-            if line.startswith('diff --git'):
-                # Save previous file if exists
-                if current_file and file_path:
-                    content = '\n'.join(current_content)
-                    if file_path.startswith('server/'):
-                        server_files[os.path.basename(file_path)] = content
-                    elif file_path.startswith('frontend/'):
-                        frontend_files[os.path.basename(file_path)] = content
-
-                # Reset for new file
-                current_file = line
-                current_content = []
-                file_path = None
-
-            # Extract file path from +++ line
-            elif line.startswith('+++') and not line.startswith('+++ /dev/null'):
-                file_path = line.split(' ')[1][2:]  # Remove "b/" prefix
-
-            # Collect content lines (those starting with +)
-            elif line.startswith('+') and not line.startswith('+++'):
-                current_content.append(line[1:])  # Remove the + sign
-
-        # Don't forget the last file
-        if current_file and file_path:
-            content = '\n'.join(current_content)
-            if file_path.startswith('server/'):
-                server_files[os.path.basename(file_path)] = content
-            elif file_path.startswith('frontend/'):
-                frontend_files[os.path.basename(file_path)] = content
-
-        return server_files, frontend_files, unified_diff
+        logger.info("Generating counter app based on: %s", user_message)
+
+        server_files, frontend_files, unified_diff = _load_counter_app_patch()
+        # copies so callers can't mutate the cached parse
+        return dict(server_files), dict(frontend_files), unified_diff
 
     def _save_files(self, server_files: Dict[str, str], frontend_files: Dict[str, str]) -> None:
         """
@@ -187,7 +203,7 @@ class TemplateDiffAgentImplementation(AgentInterface):
             file_path = os.path.join(server_dir, filename)
             with open(file_path, "w") as f:
                 f.write(content)
-            logger.info(f"Saved server file: {file_path}")
+            logger.info("Saved server file: %s", file_path)
 
         frontend_dir = os.path.join(self.temp_dir, "frontend")
         os.makedirs(frontend_dir, exist_ok=True)
@@ -196,7 +212,7 @@ class TemplateDiffAgentImplementation(AgentInterface):
             file_path = os.path.join(frontend_dir, filename)
             with open(file_path, "w") as f:
                 f.write(content)
-            logger.info(f"Saved frontend file: {file_path}")
+            logger.info("Saved frontend file: %s", file_path)
 
         metadata = {
             "server_files": list(server_files.keys()),
@@ -208,4 +224,4 @@ class TemplateDiffAgentImplementation(AgentInterface):
         with open(metadata_path, "w") as f:
             json.dump(metadata, f, indent=2)
 
-        logger.info(f"Saved metadata: {metadata_path}")
+        logger.info("Saved metadata: %s", metadata_path)
@@ -1,8 +1,11 @@
+import json
 import pytest
 from httpx import AsyncClient
+from pydantic import ValidationError
 import os
 from log import get_logger
 from api.agent_server.agent_api_client import AgentApiClient
+from api.agent_server.models import AgentMessage, AgentRequest, UserMessage, parse_conversation_message
 
 logger = get_logger(__name__)
 
@@ -94,3 +97,39 @@ async def test_template_id_support(client):
     events, request = await client.send_message("Hello", template_id="trpc_agent")
     assert len(events) > 0, "No events received with specific template"
     assert request.template_id == "trpc_agent", "Template ID should match requested value"
+
+
+CONVERSATION_MESSAGE_CASES = [
+    ({"role": "user", "content": "Hello"}, UserMessage),
+    ({"role": "assistant", "kind": "StageResult", "content": "Done"}, AgentMessage),
+    ({"content": "Hello"}, UserMessage),
+    ({"kind": "RefinementRequest", "content": "More details?"}, AgentMessage),
+]
+
+
+def _agent_request_json(message: dict) -> str:
+    return json.dumps({"allMessages": [message], "applicationId": "app", "traceId": "trace"})
+
+
+@pytest.mark.parametrize("message,expected_type", CONVERSATION_MESSAGE_CASES)
+async def test_parse_conversation_message(message, expected_type):
+    parsed = parse_conversation_message(json.dumps(message))
+    assert isinstance(parsed, expected_type)
+    assert parsed.role == expected_type.model_fields["role"].default
+
+
+@pytest.mark.parametrize("message,expected_type", CONVERSATION_MESSAGE_CASES)
+async def test_agent_request_conversation_message(message, expected_type):
+    request = AgentRequest.from_json(_agent_request_json(message))
+    assert len(request.all_messages) == 1
+    assert isinstance(request.all_messages[0], expected_type)
+
+
+async def test_parse_conversation_message_unknown_role():
+    with pytest.raises(ValidationError):
+        parse_conversation_message(json.dumps({"role": "system", "content": "Hello"}))
+
+
+async def test_agent_request_unknown_role():
+    with pytest.raises(ValidationError):
+        AgentRequest.from_json(_agent_request_json({"role": "system", "content": "Hello"}))
@@ -19,14 +19,12 @@ import os
 import csv
 import sys
 import shutil
-import tempfile
 import socket
 import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Set
 import fire
-from tests.test_e2e import run_e2e
 
 
 def log(msg: str) -> None:
@@ -123,11 +121,13 @@ class GenerationCapture:
 
     def __init__(self, output_dir: str):
         self.output_dir = Path(output_dir)
-        self.captured_temp_dir = None
         self.success = False
 
-    async def run_with_capture(self, prompt: str, template_id: str) -> bool:
-        """Run generation and capture all artifacts."""
+    async def run_with_capture(self, prompt: str, template_id: str, work_dir: Path) -> bool:
+        """Run generation, building the app in work_dir."""
+        # imported here so the matrix driver, which only spawns subprocesses, skips the agent/dagger stack
+        from tests.test_e2e import run_e2e
+
         try:
             # Run the generation with standalone=False to ensure Docker health check
             await run_e2e(
@@ -135,6 +135,7 @@ class GenerationCapture:
                 standalone=False,  # ensures Docker validation
                 with_edit=False,
                 template_id=template_id,
+                work_dir=str(work_dir),
             )
 
             self.success = True
@@ -167,56 +168,20 @@ async def run_single_generation(prompt: str, template_id: str, output_dir: str)
     # Initialize capture helper
     capture = GenerationCapture(output_dir)
 
-    # We need to monkey patch run_e2e to capture the temp_dir
-    # The challenge is that run_e2e creates its own tempfile.TemporaryDirectory
-    # We'll patch tempfile.TemporaryDirectory to capture the path
-    original_tempdir = tempfile.TemporaryDirectory
-    captured_dirs = []
-
-    class CapturingTempDir(original_tempdir):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            captured_dirs.append(self.name)
-
-        def __enter__(self):
-            result = super().__enter__()
-            if len(captured_dirs) > 0:
-                capture.captured_temp_dir = captured_dirs[-1]
-            return result
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            # Copy contents before the original __exit__ deletes the directory
-            if (
-                capture.captured_temp_dir
-                and Path(capture.captured_temp_dir).exists()
-                and capture.captured_temp_dir == self.name
-            ):
-                try:
-                    source_dir = output_path / "source_code"
-                    if source_dir.exists():
-                        shutil.rmtree(source_dir)
-
-                    # Copy the entire generated project before cleanup
-                    shutil.copytree(self.name, source_dir)
-                    log(f"Source code saved to {source_dir}")
-
-                    # List what was generated for debugging
-                    generated_files = list(source_dir.rglob("*"))
-                    log(f"Generated {len(generated_files)} files/directories")
-                except Exception as e:
-                    log(f"Failed to copy temp directory: {e}")
-
-            # Now let the original cleanup happen
-            return super().__exit__(exc_type, exc_val, exc_tb)
-
-    # Apply monkey patch
-    tempfile.TemporaryDirectory = CapturingTempDir
+    # Build the app straight into the run directory so the source survives without a copy;
+    # absolute because run_e2e chdirs into it before starting docker compose there
+    source_dir = (output_path / "source_code").resolve()
+    if source_dir.exists():
+        shutil.rmtree(source_dir)
+    source_dir.mkdir()
 
     try:
         # Run the generation
-        success = await capture.run_with_capture(prompt, template_id)
+        success = await capture.run_with_capture(prompt, template_id, source_dir)
 
-        # Copying happens automatically in CapturingTempDir.__exit__
+        log(f"Source code saved to {source_dir}")
+        generated_files = list(source_dir.rglob("*"))
+        log(f"Generated {len(generated_files)} files/directories")
 
         # Exit with appropriate code
         sys.exit(0 if success else 1)
@@ -228,10 +193,6 @@ async def run_single_generation(prompt: str, template_id: str, output_dir: str)
         traceback.print_exc()
         sys.exit(2)
 
-    finally:
-        # Restore original tempfile
-        tempfile.TemporaryDirectory = original_tempdir
-
 
 def save_run_results(
     run_dir: Path,
@@ -263,10 +224,8 @@ def save_run_results(
         },
     }
 
-    # Save all artifacts
+    # Save all artifacts (stdout.log / stderr.log are streamed by the caller while the run executes)
     (run_dir / "status.json").write_text(json.dumps(status, indent=2))
-    (run_dir / "stdout.log").write_text(subprocess_result.stdout)
-    (run_dir / "stderr.log").write_text(subprocess_result.stderr)
 
     log(f"  Result: {'✓ SUCCESS' if success else '✗ FAILED'}")
     if not success:
@@ -287,20 +246,31 @@ def generate_summary(results_dir: Path = Path("benchmark_results")) -> None:
         if not status_file.exists():
             continue
 
-        # Load status
-        status = json.loads(status_file.read_text())
+        # Load status (json.loads takes the raw bytes, no intermediate str decode)
+        status = json.loads(status_file.read_bytes())
 
         # Load telemetry if exists
         telemetry_file = run_dir / "telemetry.json"
         total_tokens = 0
         total_calls = 0
+        input_tokens = 0
+        cache_read_tokens = 0
+        cache_creation_tokens = 0
+        cache_hit_rate = 0.0
         if telemetry_file.exists():
-            telemetry = json.loads(telemetry_file.read_text())
+            telemetry = json.loads(telemetry_file.read_bytes())
             for model_stats in telemetry.values():
-                total_tokens += model_stats.get(
-                    "total_input_tokens", 0
-                ) + model_stats.get("total_output_tokens", 0)
+                model_input_tokens = model_stats.get("total_input_tokens", 0)
+                input_tokens += model_input_tokens
+                total_tokens += model_input_tokens + model_stats.get("total_output_tokens", 0)
                 total_calls += model_stats.get("total_calls", 0)
+                cache_read_tokens += model_stats.get("total_cache_read_tokens", 0)
+                cache_creation_tokens += model_stats.get("total_cache_creation_tokens", 0)
+
+            # share of prompt tokens served from the provider cache; input tokens exclude cached ones
+            prompt_tokens = input_tokens + cache_read_tokens + cache_creation_tokens
+            if prompt_tokens:
+                cache_hit_rate = round(cache_read_tokens / prompt_tokens, 4)
 
         config = status.get("config", {})
         results.append(
@@ -315,6 +285,9 @@ def generate_summary(results_dir: Path = Path("benchmark_results")) -> None:
                 "duration_seconds": status["duration_seconds"],
                 "total_tokens": total_tokens,
                 "total_model_calls": total_calls,
+                "cache_read_tokens": cache_read_tokens,
+                "cache_creation_tokens": cache_creation_tokens,
+                "cache_hit_rate": cache_hit_rate,
                 "exit_code": status["exit_code"],
                 "timestamp": status["timestamp"],
             }
@@ -352,9 +325,9 @@ def run_single_benchmark(
     total: int,
     results_dir: Path,
     timeout_minutes: int,
-    resume: bool,
+    completed_runs: Set[str],
 ) -> None:
-    """Run a single benchmark configuration."""
+    """Run a single benchmark configuration, skipping it if its run name is in completed_runs."""
     (
         (prompt_name, prompt_text),
         template_id,
@@ -369,7 +342,7 @@ def run_single_benchmark(
     run_dir = results_dir / run_name
 
     # Skip if already completed and in resume mode
-    if resume and (run_dir / "status.json").exists():
+    if run_name in completed_runs:
         log(f"[{idx}/{total}] Skipping {run_name} - already completed")
         return
 
@@ -407,10 +380,13 @@ def run_single_benchmark(
             "universal_model_name": universal_name,
         }
 
-        # Run generation subprocess
+        # Run generation subprocess, streaming its output straight into the run's log files
+        # so the driver never holds a whole generation log in memory
         start_time = datetime.now()
-        process = None
-        try:
+        with (
+            open(run_dir / "stdout.log", "w") as stdout_log,
+            open(run_dir / "stderr.log", "w") as stderr_log,
+        ):
             process = subprocess.Popen(
                 [
                     "uv",
@@ -426,52 +402,33 @@ def run_single_benchmark(
                     str(run_dir),
                 ],
                 env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=stdout_log,
+                stderr=stderr_log,
                 text=True,
             )
 
-            # wait for completion with timeout
-            stdout, stderr = process.communicate(timeout=timeout_minutes * 60)
-            result = subprocess.CompletedProcess(
-                args=process.args,
-                returncode=process.returncode,
-                stdout=stdout,
-                stderr=stderr,
-            )
+            try:
+                # wait for completion with timeout
+                returncode = process.wait(timeout=timeout_minutes * 60)
 
-        except subprocess.TimeoutExpired:
-            log(f"  [{idx}/{total}] TIMEOUT {run_name} after {timeout_minutes} minutes")
+            except subprocess.TimeoutExpired:
+                log(f"  [{idx}/{total}] TIMEOUT {run_name} after {timeout_minutes} minutes")
 
-            # first try graceful termination to allow telemetry saving
-            if process:
+                # first try graceful termination to allow telemetry saving
                 try:
                     process.terminate()  # sends SIGTERM
-                    stdout, stderr = process.communicate(
-                        timeout=5
-                    )  # give 5 seconds for graceful shutdown
+                    process.wait(timeout=5)  # give 5 seconds for graceful shutdown
                     log("  Process terminated gracefully")
                 except subprocess.TimeoutExpired:
                     # if graceful termination fails, force kill
                     log("  Graceful termination failed, force killing process")
                     process.kill()
-                    stdout, stderr = process.communicate()
-
-                result = subprocess.CompletedProcess(
-                    args=process.args,
-                    returncode=124,
-                    stdout=stdout or "",
-                    stderr=(stderr or "")
-                    + f"\nProcess timed out after {timeout_minutes} minutes",
-                )
-            else:
-                # fallback for the unlikely case where process wasn't created
-                result = subprocess.CompletedProcess(
-                    args=[],
-                    returncode=124,
-                    stdout="",
-                    stderr=f"Process timed out after {timeout_minutes} minutes",
-                )
+                    process.wait()
+
+                returncode = 124
+                stderr_log.write(f"\nProcess timed out after {timeout_minutes} minutes")
+
+        result = subprocess.CompletedProcess(args=process.args, returncode=returncode)
 
         duration = (datetime.now() - start_time).total_seconds()
 
@@ -526,6 +483,15 @@ def matrix(concurrent: int = 1, resume=True) -> None:
     results_dir = Path("benchmark_results")
     results_dir.mkdir(exist_ok=True)
 
+    # collect finished runs with one directory listing instead of a stat per combination
+    completed_runs: Set[str] = set()
+    if resume:
+        completed_runs = {
+            run_dir.name
+            for run_dir in results_dir.iterdir()
+            if (run_dir / "status.json").exists()
+        }
+
     if concurrent <= 1:
         # Sequential execution (backward compatible)
         for idx, config in enumerate(matrix_combinations, 1):
@@ -535,7 +501,7 @@ def matrix(concurrent: int = 1, resume=True) -> None:
                 len(matrix_combinations),
                 results_dir,
                 timeout_minutes,
-                resume,
+                completed_runs,
             )
     else:
         # Concurrent execution using ThreadPoolExecutor
@@ -556,7 +522,7 @@ def matrix(concurrent: int = 1, resume=True) -> None:
                     len(matrix_combinations),
                     results_dir,
                     timeout_minutes,
-                    resume,
+                    completed_runs,
                 )
                 futures.append(future)
 
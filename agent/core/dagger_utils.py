@@ -1,7 +1,7 @@
 import os
 import tempfile
+import anyio
 import dagger
-from pathlib import Path
 from typing import Self
 
 
@@ -17,19 +17,34 @@ class ExecResult:
 
     @classmethod
     async def from_ctr(cls, ctr: dagger.Container) -> Self:
-        return cls(
-            exit_code=await ctr.exit_code(),
-            stdout=await ctr.stdout(),
-            stderr=await ctr.stderr(),
-        )
+        # resolve all three concurrently; the task group cancels the remaining queries as soon as one fails
+        results = {}
+
+        async def resolve(name, query):
+            results[name] = await query()
+
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(resolve, "exit_code", ctr.exit_code)
+                tg.start_soon(resolve, "stdout", ctr.stdout)
+                tg.start_soon(resolve, "stderr", ctr.stderr)
+        except BaseExceptionGroup as excgroup:
+            # the queries share one exec and usually fail together; re-raise the first original dagger
+            # error so retry_transport_errors and callers catching dagger errors can match on it
+            errors = [e for e in excgroup.exceptions if not isinstance(e, anyio.get_cancelled_exc_class())]
+            raise (errors or excgroup.exceptions)[0] from None
+        return cls(**results)
 
 
 async def write_files_bulk(ctr: dagger.Container, files: dict[str, str], client: dagger.Client) -> dagger.Container:
     with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {file_path: os.path.join(temp_dir, file_path) for file_path in files}
+        # create each parent directory once rather than once per file
+        for parent in sorted({os.path.dirname(path) for path in paths.values()}):
+            os.makedirs(parent, exist_ok=True)
         for file_path, content in files.items():
-            file = Path(os.path.join(temp_dir, file_path))
-            file.parent.mkdir(parents=True, exist_ok=True)
-            file.write_text(content)
+            with open(paths[file_path], "wb") as f:
+                f.write(content.encode("utf-8"))
         directory = client.host().directory(temp_dir)
         ctr = ctr.with_directory(".", directory)
         return await ctr.sync()
@@ -1,3 +1,4 @@
+import functools
 import jinja2
 import logging
 import anyio
@@ -14,6 +15,12 @@ from core.notification_utils import notify_if_callback, notify_stage
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _user_prompt_template() -> jinja2.Template:
+    """Compile the playbook user prompt once per process."""
+    return jinja2.Environment().from_string(playbooks.USER_PROMPT)
+
+
 class LaravelActor(FileOperationsActor):
     root: Node[BaseData] | None = None
 
@@ -156,8 +163,7 @@ class LaravelActor(FileOperationsActor):
             protected=self.files_protected, allowed=self.files_allowed
         )
 
-        jinja_env = jinja2.Environment()
-        user_prompt_template = jinja_env.from_string(playbooks.USER_PROMPT)
+        user_prompt_template = _user_prompt_template()
         repo_files = await self.get_repo_files(workspace, files)
         project_context = "\n".join(
             [
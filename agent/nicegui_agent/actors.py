@@ -1,3 +1,4 @@
+import functools
 import jinja2
 import logging
 import anyio
@@ -13,6 +14,12 @@ from integrations.dbrx import DatabricksClient
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _user_prompt_template() -> jinja2.Template:
+    """Compile the playbook user prompt once per process."""
+    return jinja2.Environment().from_string(playbooks.USER_PROMPT)
+
+
 class NiceguiActor(FileOperationsActor):
     root: Node[BaseData] | None = None
 
@@ -72,8 +79,7 @@ class NiceguiActor(FileOperationsActor):
             protected=self.files_protected, allowed=self.files_allowed
         )
 
-        jinja_env = jinja2.Environment()
-        user_prompt_template = jinja_env.from_string(playbooks.USER_PROMPT)
+        user_prompt_template = _user_prompt_template()
         repo_files = await self.get_repo_files(workspace, files)
         project_context = "\n".join(
             [
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+import benchmark
+import tests.test_e2e
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def test_single_generation_relative_output_dir(tmp_path, monkeypatch):
+    """run_e2e chdirs into work_dir, so a relative --output-dir must reach it as an absolute path."""
+    monkeypatch.chdir(tmp_path)
+    seen = {}
+
+    async def fake_run_e2e(**kwargs):
+        work_dir = kwargs["work_dir"]
+        seen["work_dir"] = work_dir
+        os.chdir(work_dir)
+        seen["exists_after_chdir"] = os.path.isdir(work_dir)
+
+    monkeypatch.setattr(tests.test_e2e, "run_e2e", fake_run_e2e)
+
+    with pytest.raises(SystemExit) as exc_info:
+        await benchmark.run_single_generation("prompt", "trpc_agent", "benchmark_results/run")
+
+    assert exc_info.value.code == 0
+    assert os.path.isabs(seen["work_dir"])
+    assert seen["work_dir"] == str(tmp_path / "benchmark_results" / "run" / "source_code")
+    assert seen["exists_after_chdir"]
@@ -0,0 +1,43 @@
+import anyio
+import dagger
+import pytest
+
+from core.dagger_utils import ExecResult
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeContainer:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    async def _resolve(self, value):
+        await anyio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return value
+
+    async def exit_code(self):
+        return await self._resolve(0)
+
+    async def stdout(self):
+        return await self._resolve("out")
+
+    async def stderr(self):
+        return await self._resolve("err")
+
+
+async def test_from_ctr():
+    result = await ExecResult.from_ctr(FakeContainer())
+    assert (result.exit_code, result.stdout, result.stderr) == (0, "out", "err")
+
+
+async def test_from_ctr_queries_fail_together():
+    """A failed exec fails every query; callers must see the dagger error, not an ExceptionGroup."""
+    with pytest.raises(dagger.TransportError, match="exec failed"):
+        await ExecResult.from_ctr(FakeContainer(dagger.TransportError("exec failed")))
@@ -70,7 +70,13 @@ async def run_e2e(
     with_edit=True,
     template_id=None,
     use_databricks=False,
+    work_dir: str | None = None,
 ):
+    """Generate an app through the agent server, apply its diff and check the app comes up healthy.
+
+    By default the app is assembled in a throwaway temporary directory; pass work_dir to build it
+    in a caller-owned directory that is kept afterwards.
+    """
     context = empty_context() if standalone else spawn_local_server()
     settings = {}
     if use_databricks:
@@ -126,7 +132,13 @@ async def run_e2e(
             logger.info(f"Generated app_name: {app_name}")
             logger.info(f"Generated commit_message: {commit_message}")
 
-            with tempfile.TemporaryDirectory() as temp_dir:
+            # work_dir is made absolute: we chdir into it below and docker compose also runs with it as cwd
+            app_dir = (
+                contextlib.nullcontext(os.path.abspath(work_dir))
+                if work_dir
+                else tempfile.TemporaryDirectory()
+            )
+            with app_dir as temp_dir:
                 # Determine template path based on template_id
                 template_paths = {
                     "nicegui_agent": "nicegui_agent/template",
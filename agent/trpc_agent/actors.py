@@ -1,4 +1,5 @@
 import anyio
+import functools
 import jinja2
 import logging
 import os
@@ -16,6 +17,12 @@ from core.notification_utils import notify_if_callback, notify_stage
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _compile_prompt(template_name: str) -> jinja2.Template:
+    """Compile a playbook prompt once; playbook templates are module constants."""
+    return jinja2.Environment().from_string(getattr(playbooks, template_name))
+
+
 @dataclass
 class TrpcPaths:
     """File path configuration for tRPC actor."""
@@ -715,9 +722,7 @@ class TrpcActor(FileOperationsActor):
 
     def _render_prompt(self, template_name: str, **kwargs) -> str:
         """Render Jinja template with given parameters."""
-        jinja_env = jinja2.Environment()
-        template = jinja_env.from_string(getattr(playbooks, template_name))
-        return template.render(**kwargs)
+        return _compile_prompt(template_name).render(**kwargs)
 
     def _create_node_with_files(
         self,
@@ -2,6 +2,7 @@ import re
 import os
 import logging
 import contextlib
+import functools
 from collections import defaultdict
 from typing import Literal
 from tempfile import TemporaryDirectory
@@ -19,6 +20,12 @@ import dagger
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _compile_template(source: str) -> jinja2.Template:
+    """Compile a validation prompt once; the sources are playbook constants."""
+    return jinja2.Environment().from_string(source)
+
+
 async def drizzle_push(
     client: dagger.Client, ctr: dagger.Container, postgresdb: dagger.Service | None
 ) -> ExecResult:
@@ -180,7 +187,7 @@ class PlaywrightRunner:
                             # remove stochastic parts of the logs for caching
                             console_logs += self._ts_cleanup_pattern.sub(r"\1", logs)
 
-                prompt = jinja2.Environment().from_string(prompt_template)
+                prompt = _compile_template(prompt_template)
                 prompt_rendered = prompt.render(
                     console_logs=console_logs, user_prompt=user_prompt
                 )
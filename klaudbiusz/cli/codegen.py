@@ -48,6 +48,10 @@ class ToolInput:
     prompt: str = ""
 
 
+def _truncate(text: str, max_len: int = 300) -> str:
+    return text if len(text) <= max_len else text[:max_len] + "..."
+
+
 def _parse_agent_definition(agent_file: Path) -> tuple[dict[str, str], str] | None:
     """Parse agent markdown file with YAML frontmatter.
 
@@ -313,17 +317,21 @@ Use up to 10 tools per call to speed up the process.\n"""
 
         return metrics
 
-    async def _log_tool_use(self, block: ToolUseBlock, truncate) -> None:
+    def _should_log(self, level: int = logging.INFO) -> bool:
+        # checked before building log strings so nothing is formatted when logs are suppressed or filtered
+        return not self.suppress_logs and logger.isEnabledFor(level)
+
+    async def _log_tool_use(self, block: ToolUseBlock) -> None:
         input_dict = block.input or {}
         tool_input = ToolInput(
             subagent_type=input_dict.get("subagent_type", "unknown"),
             description=input_dict.get("description", ""),
             prompt=input_dict.get("prompt", ""),
         )
-        if not self.suppress_logs:
+        if self._should_log():
             logger.info(f"🚀 Delegating to subagent: {tool_input.subagent_type}")
             logger.info(f"   Task: {tool_input.description}")
-            logger.info(f"   Instructions: {truncate(tool_input.prompt, 200)}")
+            logger.info(f"   Instructions: {_truncate(tool_input.prompt, 200)}")
         await self.tracker.log(
             self.run_id,
             "assistant",
@@ -331,12 +339,12 @@ Use up to 10 tools per call to speed up the process.\n"""
             f"subagent={tool_input.subagent_type}, task={tool_input.description}, prompt={tool_input.prompt}",
         )
 
-    async def _log_todo_update(self, block: ToolUseBlock, truncate) -> None:
+    async def _log_todo_update(self, block: ToolUseBlock) -> None:
         input_dict = block.input or {}
         todos = input_dict.get("todos", [])
+        completed = sum(1 for t in todos if t.get("status") == "completed")
 
-        if not self.suppress_logs and todos:
-            completed = sum(1 for t in todos if t.get("status") == "completed")
+        if todos and self._should_log():
             in_progress = [t for t in todos if t.get("status") == "in_progress"]
 
             logger.info(f"📋 Todo update: {completed}/{len(todos)} completed")
@@ -347,40 +355,34 @@ Use up to 10 tools per call to speed up the process.\n"""
             self.run_id,
             "assistant",
             "todo_update",
-            f"todos={len(todos)}, completed={sum(1 for t in todos if t.get('status') == 'completed')}",
+            f"todos={len(todos)}, completed={completed}",
         )
 
-    async def _log_generic_tool(self, block: ToolUseBlock, truncate) -> None:
+    async def _log_generic_tool(self, block: ToolUseBlock) -> None:
         params = ", ".join(f"{k}={v}" for k, v in (block.input or {}).items())
-        if not self.suppress_logs:
-            logger.info(f"🔧 Tool: {block.name}({truncate(params, 150)})")
+        if self._should_log():
+            logger.info(f"🔧 Tool: {block.name}({_truncate(params, 150)})")
         await self.tracker.log(self.run_id, "assistant", "tool_call", f"{block.name}({params})")
 
     async def _log_assistant_message(self, message: AssistantMessage) -> None:
-        def truncate(text: str, max_len: int = 300) -> str:
-            return text if len(text) <= max_len else text[:max_len] + "..."
-
         for block in message.content:
             match block:
                 case TextBlock():
-                    if not self.suppress_logs:
+                    if self._should_log():
                         logger.info(f"💬 {block.text}")
                     await self.tracker.log(self.run_id, "assistant", "text", block.text)
                 case ToolUseBlock(name="TodoWrite"):
-                    await self._log_todo_update(block, truncate)
+                    await self._log_todo_update(block)
                 case ToolUseBlock(name="Task"):
-                    await self._log_tool_use(block, truncate)
+                    await self._log_tool_use(block)
                 case ToolUseBlock(name="mcp__edda__scaffold_data_app"):
                     if block.input is not None and "work_dir" in block.input:
                         self._pending_scaffold_calls[block.id] = block.input["work_dir"]
-                    await self._log_generic_tool(block, truncate)
+                    await self._log_generic_tool(block)
                 case ToolUseBlock():
-                    await self._log_generic_tool(block, truncate)
+                    await self._log_generic_tool(block)
 
     async def _log_user_message(self, message: UserMessage) -> None:
-        def truncate(text: str, max_len: int = 300) -> str:
-            return text if len(text) <= max_len else text[:max_len] + "..."
-
         for block in message.content:
             match block:
                 case ToolResultBlock(tool_use_id=tool_id):
@@ -388,18 +390,16 @@ Use up to 10 tools per call to speed up the process.\n"""
                         self.app_dir = self._pending_scaffold_calls.pop(tool_id)
                     result_text = str(block.content)
                     if result_text:
-                        if not self.suppress_logs:
-                            logger.info(f"✅ Tool result: {truncate(result_text)}")
+                        if self._should_log():
+                            logger.info(f"✅ Tool result: {_truncate(result_text)}")
                         await self.tracker.log(self.run_id, "user", "tool_result", result_text)
                 case ToolResultBlock(is_error=True):
-                    if not self.suppress_logs:
-                        logger.warning(f"❌ Tool error: {truncate(str(block.content))}")
-                    await self.tracker.log(self.run_id, "user", "tool_error", str(block.content))
+                    error_text = str(block.content)
+                    if self._should_log(logging.WARNING):
+                        logger.warning(f"❌ Tool error: {_truncate(error_text)}")
+                    await self.tracker.log(self.run_id, "user", "tool_error", error_text)
 
     async def _log_result_message(self, message: ResultMessage) -> None:
-        def truncate(text: str, max_len: int = 300) -> str:
-            return text if len(text) <= max_len else text[:max_len] + "..."
-
         usage_dict = message.usage or {}
         usage = UsageMetrics(
             input_tokens=usage_dict.get("input_tokens", 0),
@@ -408,13 +408,13 @@ Use up to 10 tools per call to speed up the process.\n"""
             cache_read_input_tokens=usage_dict.get("cache_read_input_tokens", 0),
         )
 
-        if not self.suppress_logs:
+        if self._should_log():
             logger.info(f"🏁 Session complete: {message.num_turns} turns, ${message.total_cost_usd:.4f}")
             logger.info(
                 f"   Tokens - in: {usage.input_tokens}, out: {usage.output_tokens}, cache_create: {usage.cache_creation_input_tokens}, cache_read: {usage.cache_read_input_tokens}"
             )
             if message.result:
-                logger.info(f"Final result: {truncate(message.result)}")
+                logger.info(f"Final result: {_truncate(message.result)}")
 
         await self.tracker.log(
             self.run_id,